@@ -21,7 +21,7 @@ try:
     import yaml
     from omegaconf import OmegaConf
 except ImportError as e:
-    logging.warning(f"Configuration libraries not available: {e}")
+    logging.warning("Configuration libraries not available: %s", e)
     yaml = None
     OmegaConf = None
 
@@ -53,7 +53,7 @@ try:
     # Note: HunyuanVideoPipeline and LTXVideoPipeline may not be available in standard diffusers
     # They will be loaded dynamically if available
 except ImportError as e:
-    logging.warning(f"Some diffusers components not available: {e}")
+    logging.warning("Some diffusers components not available: %s", e)
 
 try:
     from transformers import (
@@ -64,7 +64,7 @@ try:
         CLIPTextModel
     )
 except ImportError as e:
-    logging.error(f"Transformers import failed: {e}")
+    logging.error("Transformers import failed: %s", e)
     raise
 
 try:
@@ -142,6 +142,7 @@ class CinemaPipeline:
         
         # Fast initialization - don't load models until needed
         self.models_loaded = False
+        self.loaded_models = ()
         self.loading_lock = asyncio.Lock()
 
         # Initialize script processor (lightweight)
@@ -154,7 +155,7 @@ class CinemaPipeline:
         if torch.cuda.is_available():
             gpu_name = torch.cuda.get_device_name(0)
             vram_gb = torch.cuda.get_device_properties(0).total_memory / 1024**3
-            logger.info(f"GPU: {gpu_name} with {vram_gb:.1f}GB VRAM")
+            logger.info("GPU: %s with %.1fGB VRAM", gpu_name, vram_gb)
 
             # Optimized modes for speed
             if vram_gb >= 80:
@@ -174,10 +175,22 @@ class CinemaPipeline:
             self.max_duration = 5
             self.enable_parallel = False
 
-        logger.info(f"Running in {self.mode} mode - max duration: {self.max_duration}s")
+        logger.info("Running in %s mode - max duration: %ss", self.mode, self.max_duration)
 
         # Don't initialize models here - lazy loading for faster cold starts
 
+    def _refresh_loaded(self):
+        """Snapshot the names of successfully loaded models for cheap lookups"""
+        self.loaded_models = tuple(sorted(name for name, model in self.models.items() if model))
+
+    def clear_models(self):
+        """Drop all loaded models so the next job reloads them"""
+        self.models.clear()
+        self.models_loaded = False
+        self._refresh_loaded()
+        cleanup()
+        logger.info("Model cache cleared")
+
     async def _ensure_models_loaded(self):
         """Lazy load models only when needed for faster cold starts"""
         if self.models_loaded:
@@ -196,6 +209,7 @@ class CinemaPipeline:
                 await self._load_minimal_model_async()
             
             self.models_loaded = True
+            self._refresh_loaded()
             logger.info("Essential models loaded successfully")
 
     async def _load_ltx_model_async(self):
@@ -221,7 +235,7 @@ class CinemaPipeline:
                     
                     return model
                 except Exception as e:
-                    logger.error(f"Failed to load LTX-Video: {e}")
+                    logger.error("Failed to load LTX-Video: %s", e)
                     return None
             
             # Load in background thread
@@ -234,7 +248,7 @@ class CinemaPipeline:
                 logger.warning("❌ LTX-Video failed to load")
                 
         except Exception as e:
-            logger.error(f"LTX model loading error: {e}")
+            logger.error("LTX model loading error: %s", e)
             self.models["ltx"] = None
 
     async def _load_minimal_model_async(self):
@@ -245,7 +259,7 @@ class CinemaPipeline:
             self.models["minimal"] = True
             logger.info("✅ Minimal model ready")
         except Exception as e:
-            logger.error(f"Minimal model error: {e}")
+            logger.error("Minimal model error: %s", e)
             self.models["minimal"] = None
 
     def _load_video_models(self):
@@ -277,7 +291,7 @@ class CinemaPipeline:
                         use_safetensors=True
                     ).to(self.device)
                 except Exception as e:
-                    logger.error(f"Failed to load HunyuanVideo: {e}")
+                    logger.error("Failed to load HunyuanVideo: %s", e)
                     self.enable_hunyuan = False
 
             if self.enable_ltx:
@@ -306,11 +320,11 @@ class CinemaPipeline:
                         use_safetensors=True
                     ).to(self.device)
                 except Exception as e:
-                    logger.error(f"Failed to load LTX-Video: {e}")
+                    logger.error("Failed to load LTX-Video: %s", e)
                     self.enable_ltx = False
 
         except Exception as e:
-            logger.error(f"Failed to load video models: {e}")
+            logger.error("Failed to load video models: %s", e)
             # Fallback to simpler model
             self._load_fallback_video_model()
 
@@ -325,7 +339,7 @@ class CinemaPipeline:
             ).to(self.device)
             self.models["fallback_video"].enable_model_cpu_offload()
         except Exception as e:
-            logger.error(f"Failed to load fallback model: {e}")
+            logger.error("Failed to load fallback model: %s", e)
 
     def _load_audio_models(self):
         """Load audio generation models"""
@@ -371,7 +385,7 @@ class CinemaPipeline:
                 self.human_sounds = None
 
         except Exception as e:
-            logger.error(f"Failed to load audio models: {e}")
+            logger.error("Failed to load audio models: %s", e)
             self.models["musicgen"] = None
             self.models["audiogen"] = None
             self.human_sounds = None
@@ -392,7 +406,7 @@ class CinemaPipeline:
                 self.models["tts"] = None
 
         except Exception as e:
-            logger.error(f"Failed to load TTS model: {e}")
+            logger.error("Failed to load TTS model: %s", e)
             # Fallback to simpler TTS
             try:
                 if TTS is not None:
@@ -436,7 +450,7 @@ class CinemaPipeline:
             logger.info("✅ Lip sync and facial models loaded successfully")
 
         except Exception as e:
-            logger.error(f"Failed to load lip sync models: {e}")
+            logger.error("Failed to load lip sync models: %s", e)
             # Fallback to basic video processing
             self.models["wav2lip"] = None
             self.models["face_expression"] = None
@@ -450,10 +464,10 @@ class CinemaPipeline:
         # Enforce duration limits for speed
         max_duration = min(scene.duration, self.max_duration)
         if scene.duration != max_duration:
-            logger.info(f"Limiting duration from {scene.duration}s to {max_duration}s for speed")
+            logger.info("Limiting duration from %ss to %ss for speed", scene.duration, max_duration)
             scene.duration = max_duration
         
-        logger.info(f"Generating {scene.duration}s video for scene {scene.id}")
+        logger.info("Generating %ss video for scene %s", scene.duration, scene.id)
 
         # Fast generation strategy
         if self.models.get("ltx"):
@@ -465,7 +479,7 @@ class CinemaPipeline:
 
     async def _generate_ltx_fast(self, scene: Scene) -> str:
         """Generate video with LTX-Video optimized for speed"""
-        logger.info(f"Fast LTX generation: {scene.duration}s video")
+        logger.info("Fast LTX generation: %ss video", scene.duration)
 
         prompt = self._prepare_video_prompt(scene)
         
@@ -493,11 +507,11 @@ class CinemaPipeline:
             output_path = f"/app/output/video_{scene.id}_fast.mp4"
             await self._save_video_async(video_frames, output_path, 24)
             
-            logger.info(f"Fast video saved: {output_path}")
+            logger.info("Fast video saved: %s", output_path)
             return output_path
             
         except Exception as e:
-            logger.error(f"Fast LTX generation failed: {e}")
+            logger.error("Fast LTX generation failed: %s", e)
             return await self._generate_minimal_video(scene)
 
     def _get_fast_resolution(self, resolution: str) -> Tuple[int, int]:
@@ -531,7 +545,7 @@ class CinemaPipeline:
                 )
                 return True
             except Exception as e:
-                logger.error(f"Video save error: {e}")
+                logger.error("Video save error: %s", e)
                 return False
         
         loop = asyncio.get_event_loop()
@@ -540,7 +554,7 @@ class CinemaPipeline:
 
     async def _generate_minimal_video(self, scene: Scene) -> str:
         """Generate video using minimal stable diffusion model"""
-        logger.info(f"Generating minimal video for {scene.id}")
+        logger.info("Generating minimal video for %s", scene.id)
         
         def create_minimal_video():
             try:
@@ -616,7 +630,7 @@ class CinemaPipeline:
                 return output_path
                 
             except Exception as e:
-                logger.error(f"Minimal video generation failed: {e}")
+                logger.error("Minimal video generation failed: %s", e)
                 return None
         
         loop = asyncio.get_event_loop()
@@ -624,7 +638,7 @@ class CinemaPipeline:
 
     async def _generate_hunyuan_video(self, scene: Scene) -> str:
         """Generate video with HunyuanVideo"""
-        logger.info(f"Using HunyuanVideo for {scene.duration}s video")
+        logger.info("Using HunyuanVideo for %ss video", scene.duration)
 
         # Prepare prompt with camera movements
         prompt = self._prepare_video_prompt(scene)
@@ -648,12 +662,12 @@ class CinemaPipeline:
         output_path = f"/app/output/video_{scene.id}.mp4"
         self._save_video(video_frames, output_path, scene.fps)
 
-        logger.info(f"Video saved to {output_path}")
+        logger.info("Video saved to %s", output_path)
         return output_path
 
     async def _generate_ltx_video(self, scene: Scene) -> str:
         """Generate video with LTX-Video (fast)"""
-        logger.info(f"Using LTX-Video for {scene.duration}s video")
+        logger.info("Using LTX-Video for %ss video", scene.duration)
 
         prompt = self._prepare_video_prompt(scene)
         height, width = self._get_resolution(scene.resolution)
@@ -677,7 +691,7 @@ class CinemaPipeline:
 
     async def _generate_ltx_extended(self, scene: Scene) -> str:
         """Generate longer video using temporal blending"""
-        logger.info(f"Generating extended {scene.duration}s video with LTX")
+        logger.info("Generating extended %ss video with LTX", scene.duration)
 
         segments = []
         segment_duration = 8  # 8 second segments
@@ -732,7 +746,7 @@ class CinemaPipeline:
 
     async def generate_audio(self, scene: Scene) -> Dict[str, str]:
         """Generate all audio elements"""
-        logger.info(f"Generating audio for scene {scene.id}")
+        logger.info("Generating audio for scene %s", scene.id)
 
         results = {}
 
@@ -854,7 +868,7 @@ class CinemaPipeline:
 
     async def process_natural_language_prompt(self, prompt: str, options: Dict = None) -> Dict:
         """Process natural language prompt with multi-character dialogue"""
-        logger.info(f"Processing natural language prompt: {prompt[:100]}...")
+        logger.info("Processing natural language prompt: %s...", prompt[:100])
         
         try:
             # Parse the natural language prompt
@@ -881,7 +895,7 @@ class CinemaPipeline:
             }
             
         except Exception as e:
-            logger.error(f"Natural language processing failed: {e}")
+            logger.error("Natural language processing failed: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -1048,7 +1062,7 @@ class CinemaPipeline:
 
     async def develop_concept(self, concept: str, options: Dict = None) -> Dict:
         """Develop a concept into a full script"""
-        logger.info(f"Developing concept into script: {concept[:100]}...")
+        logger.info("Developing concept into script: %s...", concept[:100])
 
         # Use DeepSeek to develop concept
         result = await self.script_processor.develop_concept(concept, options)
@@ -1087,7 +1101,7 @@ class CinemaPipeline:
 
     async def _generate_dialogue(self, scene: Scene) -> str:
         """Generate dialogue with voice cloning"""
-        logger.info(f"Generating dialogue for {len(scene.dialogue)} lines")
+        logger.info("Generating dialogue for %s lines", len(scene.dialogue))
 
         audio_segments = []
 
@@ -1106,7 +1120,7 @@ class CinemaPipeline:
 
             if voice_sample and self.models.get("tts"):
                 # Use XTTS for voice cloning
-                logger.info(f"Cloning voice for {character}")
+                logger.info("Cloning voice for %s", character)
 
                 # Generate with voice cloning
                 wav = self.models["tts"].tts(
@@ -1137,7 +1151,7 @@ class CinemaPipeline:
 
     async def _generate_music(self, scene: Scene) -> str:
         """Generate background music"""
-        logger.info(f"Generating {scene.music_mood} music for {scene.duration}s")
+        logger.info("Generating %s music for %ss", scene.music_mood, scene.duration)
 
         if not self.models.get("musicgen"):
             return None
@@ -1175,7 +1189,7 @@ class CinemaPipeline:
 
     async def _generate_sound_effects(self, scene: Scene) -> List[str]:
         """Generate sound effects"""
-        logger.info(f"Generating {len(scene.sound_effects)} sound effects")
+        logger.info("Generating %s sound effects", len(scene.sound_effects))
 
         if not self.models.get("audiogen"):
             return []
@@ -1183,7 +1197,7 @@ class CinemaPipeline:
         sfx_paths = []
 
         for effect in scene.sound_effects:
-            logger.info(f"Generating SFX: {effect}")
+            logger.info("Generating SFX: %s", effect)
 
             # Enhanced prompt for better quality
             prompt = f"high quality {effect} sound effect, clear, realistic"
@@ -1257,7 +1271,7 @@ class CinemaPipeline:
                     await loop.run_in_executor(self.executor, refine_video)
                     output_path = refined_path
                 
-                logger.info(f"✅ Lip sync completed: {output_path}")
+                logger.info("✅ Lip sync completed: %s", output_path)
                 return output_path
                 
             else:
@@ -1289,7 +1303,7 @@ class CinemaPipeline:
                 return await loop.run_in_executor(self.executor, basic_sync)
 
         except Exception as e:
-            logger.error(f"Lip sync failed: {e}")
+            logger.error("Lip sync failed: %s", e)
             # Return original video with audio
             try:
                 video = mpe.VideoFileClip(video_path)
@@ -1305,7 +1319,7 @@ class CinemaPipeline:
 
     async def composite_scene(self, scene: Scene, video_path: str, audio_results: Dict) -> str:
         """Composite all elements into final video"""
-        logger.info(f"Compositing scene {scene.id}")
+        logger.info("Compositing scene %s", scene.id)
 
         # Load video
         video = mpe.VideoFileClip(video_path)
@@ -1344,7 +1358,7 @@ class CinemaPipeline:
             remove_temp=True
         )
 
-        logger.info(f"Final video saved to {output_path}")
+        logger.info("Final video saved to %s", output_path)
         return output_path
 
     async def process_complete_scene(self, scene: Scene) -> Dict:
@@ -1352,8 +1366,8 @@ class CinemaPipeline:
         import time
         start_time = time.time()
 
-        logger.info(f"Processing complete scene {scene.id}")
-        logger.info(f"Duration: {scene.duration}s, Resolution: {scene.resolution}")
+        logger.info("Processing complete scene %s", scene.id)
+        logger.info("Duration: %ss, Resolution: %s", scene.duration, scene.resolution)
 
         try:
             # Generate video and audio in parallel if possible
@@ -1390,7 +1404,7 @@ class CinemaPipeline:
             }
 
         except Exception as e:
-            logger.error(f"Error processing scene: {e}")
+            logger.error("Error processing scene: %s", e)
             import traceback
             traceback.print_exc()
 
@@ -188,7 +188,7 @@ class HumanSoundsGenerator:
                     self.audiogen.to("cuda")
                 logger.info("AudioGen initialized for human sounds")
             except Exception as e:
-                logger.warning(f"Could not initialize AudioGen: {e}")
+                logger.warning("Could not initialize AudioGen: %s", e)
                 self.audiogen = None
 
     async def generate_human_sound(self, sound: HumanSound) -> Optional[str]:
@@ -201,7 +201,7 @@ class HumanSoundsGenerator:
         # Create detailed prompt
         prompt = self._create_sound_prompt(sound)
 
-        logger.info(f"Generating human sound: {prompt}")
+        logger.info("Generating human sound: %s", prompt)
 
         try:
             # Set generation parameters
@@ -232,7 +232,7 @@ class HumanSoundsGenerator:
             return output_path
 
         except Exception as e:
-            logger.error(f"Failed to generate human sound: {e}")
+            logger.error("Failed to generate human sound: %s", e)
             return None
 
     def _create_sound_prompt(self, sound: HumanSound) -> str:
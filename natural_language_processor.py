@@ -121,7 +121,7 @@ class NaturalLanguageProcessor:
                 self.nlp = spacy.load("en_core_web_sm")
                 
         except Exception as e:
-            logger.error(f"Failed to load spaCy models: {e}")
+            logger.error("Failed to load spaCy models: %s", e)
             self.nlp = None
     
     def _load_ner_pipeline(self):
@@ -135,12 +135,12 @@ class NaturalLanguageProcessor:
                 )
                 logger.info("✅ NER pipeline loaded")
         except Exception as e:
-            logger.error(f"Failed to load NER pipeline: {e}")
+            logger.error("Failed to load NER pipeline: %s", e)
             self.ner_pipeline = None
     
     async def process_natural_language_prompt(self, prompt: str) -> ParsedScene:
         """Process natural language prompt into structured scene data"""
-        logger.info(f"Processing natural language prompt: {prompt[:100]}...")
+        logger.info("Processing natural language prompt: %s...", prompt[:100])
         
         try:
             # Use DeepSeek for advanced processing if available
@@ -150,7 +150,7 @@ class NaturalLanguageProcessor:
                 return await self._process_with_local_nlp(prompt)
                 
         except Exception as e:
-            logger.error(f"Natural language processing failed: {e}")
+            logger.error("Natural language processing failed: %s", e)
             return await self._process_with_fallback(prompt)
     
     async def _process_with_deepseek(self, prompt: str) -> ParsedScene:
@@ -228,7 +228,7 @@ Be very precise in identifying:
                     raise Exception("No valid JSON found in response")
                     
         except Exception as e:
-            logger.error(f"DeepSeek processing failed: {e}")
+            logger.error("DeepSeek processing failed: %s", e)
             return await self._process_with_local_nlp(prompt)
     
     async def _process_with_local_nlp(self, prompt: str) -> ParsedScene:
@@ -5,19 +5,61 @@ Fixed AsyncIO and Volume Integration
 August 2025 Edition
 """
 
-import runpod
 import logging
 import json
 import traceback
 import os
+import re
 import time
-import subprocess
-import boto3
 from pathlib import Path
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor
 import threading
 
+def _cuda_alloc_conf() -> str:
+    """CUDA allocator settings - expandable segments need torch 2.1+"""
+    conf = "max_split_size_mb:512,garbage_collection_threshold:0.9"
+    try:
+        from importlib.metadata import version
+        major, minor = (int(part) for part in version("torch").split(".")[:2])
+        if (major, minor) >= (2, 1):
+            conf = "expandable_segments:True," + conf
+    except Exception:
+        pass
+    return conf
+
+# Set environment variables for optimal performance - must happen before
+# torch/huggingface_hub are imported, as both read them at import time
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", _cuda_alloc_conf())
+os.environ.setdefault("CUDA_LAUNCH_BLOCKING", "0")
+os.environ.setdefault("HF_HOME", "/runpod-volume/cache")
+os.environ.setdefault("DIFFUSERS_CACHE", "/runpod-volume/cache")
+os.environ.setdefault("AUDIOCRAFT_CACHE_DIR", "/runpod-volume/cache")
+
+# Enable HF Transfer (Rust multi-connection client, needs the hf-transfer package)
+os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+import boto3
+from botocore.config import Config
+
+try:
+    import torch
+    _HAS_TORCH = True
+except ImportError:
+    torch = None
+    _HAS_TORCH = False
+
+if _HAS_TORCH:
+    # cuDNN autotunes once per distinct input shape (resolution x frame count),
+    # so the search reruns for each new scene length but is reused after that;
+    # TF32 matmuls are accurate enough for the diffusion backbones
+    torch.backends.cudnn.benchmark = True
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.set_float32_matmul_precision("high")
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,6 +67,7 @@ logger = logging.getLogger(__name__)
 # Global pipeline instance - initialized once when worker starts
 pipeline = None
 pipeline_lock = threading.Lock()
+pipeline_ready = threading.Event()  # Set once the first initialization attempt finishes
 executor = ThreadPoolExecutor(max_workers=2)
 
 # Volume configuration
@@ -32,19 +75,44 @@ VOLUME_ID = "wv11ilzha0"
 S3_ENDPOINT = "https://s3api-us-ks-2.runpod.io"
 S3_REGION = "us-ks-2"
 
+# Static part of the list_models response; pipeline_mode is filled in once
+# the pipeline is initialized, only the active model list changes per call
+_LIST_MODELS_BASE = {
+    "status": "success",
+    "models": {
+        "video": ["HunyuanVideo-13B", "LTX-Video-13B"],
+        "audio": ["MusicGen-Large", "AudioGen-Medium"],
+        "tts": ["XTTS-v2"]
+    },
+    "pipeline_mode": "not_initialized"
+}
+
+# Static part of the health_check response, built once the pipeline is up
+_HEALTH_TEMPLATE: Optional[Dict] = None
+
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """Shared S3 client for the RunPod volume - keeps its connection pool warm"""
+    return boto3.client(
+        's3',
+        endpoint_url=S3_ENDPOINT,
+        region_name=S3_REGION,
+        aws_access_key_id=os.getenv('RUNPOD_AI_API_KEY', ''),
+        aws_secret_access_key=os.getenv('RUNPOD_AI_API_KEY', ''),
+        config=Config(
+            max_pool_connections=32,
+            tcp_keepalive=True,
+            retries={"total_max_attempts": 5, "mode": "adaptive"}
+        )
+    )
+
 def setup_volume_access():
     """Setup access to the RunPod volume via S3"""
     try:
         logger.info("🔧 Setting up volume access...")
         
-        # Create S3 client for RunPod volume
-        s3_client = boto3.client(
-            's3',
-            endpoint_url=S3_ENDPOINT,
-            region_name=S3_REGION,
-            aws_access_key_id=os.getenv('RUNPOD_AI_API_KEY', ''),
-            aws_secret_access_key=os.getenv('RUNPOD_AI_API_KEY', '')
-        )
+        # Shared S3 client for RunPod volume
+        s3_client = get_s3_client()
         
         # Test connection
         try:
@@ -52,17 +120,17 @@ def setup_volume_access():
             logger.info("✅ Volume access configured successfully")
             return s3_client
         except Exception as e:
-            logger.warning(f"⚠️ Volume access test failed: {e}")
+            logger.warning("⚠️ Volume access test failed: %s", e)
             return None
             
     except Exception as e:
-        logger.error(f"❌ Volume setup failed: {e}")
+        logger.error("❌ Volume setup failed: %s", e)
         return None
 
 def download_model_from_hf(model_name: str, repo_id: str, cache_dir: str):
     """Download model from Hugging Face to volume"""
     try:
-        logger.info(f"📥 Downloading {model_name} from {repo_id}...")
+        logger.info("📥 Downloading %s from %s...", model_name, repo_id)
         
         # Set environment variables for HF
         os.environ["HF_HOME"] = "/runpod-volume/cache"
@@ -74,7 +142,7 @@ def download_model_from_hf(model_name: str, repo_id: str, cache_dir: str):
         # Check if already downloaded
         marker_file = Path(cache_dir) / f".{model_name}_downloaded"
         if marker_file.exists():
-            logger.info(f"✅ {model_name} already downloaded")
+            logger.info("✅ %s already downloaded", model_name)
             return True
         
         # Download using huggingface_hub
@@ -90,127 +158,212 @@ def download_model_from_hf(model_name: str, repo_id: str, cache_dir: str):
         
         # Create marker file
         marker_file.touch()
-        logger.info(f"✅ {model_name} downloaded successfully")
+        logger.info("✅ %s downloaded successfully", model_name)
         return True
         
     except Exception as e:
-        logger.error(f"❌ Failed to download {model_name}: {e}")
+        logger.error("❌ Failed to download %s: %s", model_name, e)
         return False
 
 def initialize_pipeline():
     """Initialize pipeline with fast cold start optimization"""
-    global pipeline
+    global pipeline, _LIST_MODELS_BASE, _HEALTH_TEMPLATE
+    
+    # Lock-free fast path once the pipeline exists
+    if pipeline is not None:
+        return pipeline
     
     with pipeline_lock:
         if pipeline is not None:
             return pipeline
+
+        try:
+            pipeline = _create_pipeline()
+            if pipeline is not None:
+                _LIST_MODELS_BASE = {**_LIST_MODELS_BASE, "pipeline_mode": pipeline.mode}
+                _HEALTH_TEMPLATE = _build_health_template(pipeline)
+                _warmup_cuda()
+        finally:
+            pipeline_ready.set()
+        return pipeline
+
+@lru_cache(maxsize=None)
+def _gpu_info() -> Dict[str, Any]:
+    """GPU constants, queried from the CUDA runtime once per worker"""
+    available = _HAS_TORCH and torch.cuda.is_available()
+    info = {
+        "available": available,
+        "device_count": torch.cuda.device_count() if available else 0
+    }
+    if available:
+        info["name"] = torch.cuda.get_device_name(0)
+        info["total_memory"] = torch.cuda.get_device_properties(0).total_memory
+    return info
+
+def _warmup_cuda():
+    """Create the CUDA context and cuBLAS handle on each GPU before the first job"""
+    gpu_info = _gpu_info()
+    if not gpu_info["available"]:
+        return
+    
+    try:
+        for index in range(gpu_info["device_count"]):
+            device = torch.device("cuda", index)
+            matrix = torch.randn(64, 64, device=device)
+            torch.matmul(matrix, matrix)
+            torch.cuda.synchronize(device)
+            del matrix
+        logger.info("🔥 CUDA context warmed up")
+    except Exception as e:
+        logger.warning("⚠️ CUDA warmup failed: %s", e)
+
+def _volume_status() -> Dict:
+    """Mount state and free space of the volume, read with plain syscalls"""
+    status = {"mounted": os.path.ismount("/runpod-volume")}
+    if status["mounted"]:
+        stats = os.statvfs("/runpod-volume")
+        status["free_gb"] = stats.f_bavail * stats.f_frsize / 1024**3
+    return status
+
+def _build_health_template(pipeline) -> Dict:
+    """Build the static part of the health_check response"""
+    gpu_info = _gpu_info()
+    gpu_available = gpu_info["available"]
+    template = {
+        "status": "healthy" if pipeline else "unhealthy",
+        "system": {
+            "gpu_available": gpu_available,
+            "device_count": gpu_info["device_count"]
+        },
+        "pipeline": {
+            "initialized": pipeline is not None,
+            "mode": pipeline.mode if pipeline else "not_initialized"
+        },
+        "volume": {
+            "id": VOLUME_ID,
+            "endpoint": S3_ENDPOINT
+        }
+    }
+    
+    if gpu_available:
+        template["gpu"] = {
+            "name": gpu_info["name"],
+            "vram_total_gb": gpu_info["total_memory"] / 1024**3
+        }
+    
+    return template
+
+def _create_pipeline():
+    """Build the best pipeline the environment supports"""
+    logger.info("🚀 Fast Cold Start - Cinema AI Pipeline v2.1")
+    start_time = time.time()
+    
+    try:
+        # Setup volume access
+        s3_client = setup_volume_access()
+        
+        # Check PyTorch first
+        if not _HAS_TORCH:
+            logger.error("❌ PyTorch not available")
+            return None
+        
+        logger.info("✅ PyTorch: %s", torch.__version__)
+        gpu_info = _gpu_info()
+        logger.info("✅ CUDA Available: %s", gpu_info["available"])
+        
+        if gpu_info["available"]:
+            gpu_name = gpu_info["name"]
+            vram = gpu_info["total_memory"] / 1024**3
+            logger.info("✅ GPU: %s", gpu_name)
+            logger.info("✅ VRAM: %.1fGB", vram)
             
-        logger.info("🚀 Fast Cold Start - Cinema AI Pipeline v2.1")
-        start_time = time.time()
+            # Determine mode based on VRAM
+            if vram >= 80:
+                logger.info("🎬 Full Cinema Mode: All models enabled")
+                mode = "cinema"
+            elif vram >= 40:
+                logger.info("⚡ Balanced Mode: Optimized models")
+                mode = "balanced"
+            else:
+                logger.info("🚀 Fast Mode: Consumer GPU optimized")
+                mode = "fast"
+        else:
+            logger.warning("⚠️ No GPU detected")
+            mode = "cpu"
+
+        # Set up model directories with volume mount
+        model_dirs = {
+            "cache": "/runpod-volume/cache",
+            "ltx": "/runpod-volume/ltx",
+            "hunyuan": "/runpod-volume/hunyuan", 
+            "musicgen": "/runpod-volume/musicgen",
+            "audiogen": "/runpod-volume/audiogen",
+            "xtts": "/runpod-volume/xtts"
+        }
+        
+        # Create directories
+        for name, path in model_dirs.items():
+            Path(path).mkdir(parents=True, exist_ok=True)
+            logger.info("📁 Created directory: %s", path)
+
+        # Skip model downloads during cold start for speed
+        # Models will be downloaded on-demand when first used
+        logger.info("⚡ Skipping model downloads for fast cold start")
+        logger.info("📥 Models will download on first use")
+
+        # Try to import and initialize cinema pipeline
+        logger.info("🔄 Initializing cinema pipeline...")
         
         try:
-            # Setup volume access
-            s3_client = setup_volume_access()
+            from cinema_pipeline import CinemaPipeline, Scene
+            logger.info("✅ Cinema pipeline modules imported")
             
-            # Check PyTorch first
-            try:
-                import torch
-                logger.info(f"✅ PyTorch: {torch.__version__}")
-                logger.info(f"✅ CUDA Available: {torch.cuda.is_available()}")
-                
-                if torch.cuda.is_available():
-                    gpu_name = torch.cuda.get_device_name(0)
-                    vram = torch.cuda.get_device_properties(0).total_memory / 1024**3
-                    logger.info(f"✅ GPU: {gpu_name}")
-                    logger.info(f"✅ VRAM: {vram:.1f}GB")
-                    
-                    # Determine mode based on VRAM
-                    if vram >= 80:
-                        logger.info("🎬 Full Cinema Mode: All models enabled")
-                        mode = "cinema"
-                    elif vram >= 40:
-                        logger.info("⚡ Balanced Mode: Optimized models")
-                        mode = "balanced"
-                    else:
-                        logger.info("🚀 Fast Mode: Consumer GPU optimized")
-                        mode = "fast"
-                else:
-                    logger.warning("⚠️ No GPU detected")
-                    mode = "cpu"
-                    
-            except ImportError:
-                logger.error("❌ PyTorch not available")
-                return None
-
-            # Set up model directories with volume mount
-            model_dirs = {
-                "cache": "/runpod-volume/cache",
-                "ltx": "/runpod-volume/ltx",
-                "hunyuan": "/runpod-volume/hunyuan", 
-                "musicgen": "/runpod-volume/musicgen",
-                "audiogen": "/runpod-volume/audiogen",
-                "xtts": "/runpod-volume/xtts"
-            }
+            # Initialize the pipeline (fast mode)
+            pipeline = CinemaPipeline()
             
-            # Create directories
-            for name, path in model_dirs.items():
-                Path(path).mkdir(parents=True, exist_ok=True)
-                logger.info(f"📁 Created directory: {path}")
-
-            # Skip model downloads during cold start for speed
-            # Models will be downloaded on-demand when first used
-            logger.info("⚡ Skipping model downloads for fast cold start")
-            logger.info("📥 Models will download on first use")
-
-            # Try to import and initialize cinema pipeline
-            logger.info("🔄 Initializing cinema pipeline...")
+            cold_start_time = time.time() - start_time
+            logger.info("✅ Pipeline initialized in %.2fs!", cold_start_time)
+            logger.info("⚡ Fast cold start complete - models load on-demand")
+            
+            return pipeline
+            
+        except ImportError as e:
+            logger.error("❌ Cinema pipeline import failed: %s", e)
+            logger.error("   Creating fallback pipeline...")
+            
+            # Create a basic fallback pipeline
+            pipeline = BasicPipeline(mode)
+            logger.info("✅ Fallback pipeline initialized")
+            return pipeline
             
-            try:
-                from cinema_pipeline import CinemaPipeline, Scene
-                logger.info("✅ Cinema pipeline modules imported")
-                
-                # Initialize the pipeline (fast mode)
-                pipeline = CinemaPipeline()
-                
-                cold_start_time = time.time() - start_time
-                logger.info(f"✅ Pipeline initialized in {cold_start_time:.2f}s!")
-                logger.info("⚡ Fast cold start complete - models load on-demand")
-                
-                return pipeline
-                
-            except ImportError as e:
-                logger.error(f"❌ Cinema pipeline import failed: {e}")
-                logger.error("   Creating fallback pipeline...")
-                
-                # Create a basic fallback pipeline
-                pipeline = BasicPipeline(mode)
-                logger.info("✅ Fallback pipeline initialized")
-                return pipeline
-                
-            except Exception as e:
-                logger.error(f"❌ Pipeline initialization failed: {e}")
-                logger.error(traceback.format_exc())
-                
-                # Create minimal pipeline
-                pipeline = MinimalPipeline()
-                logger.info("✅ Minimal pipeline initialized")
-                return pipeline
-
         except Exception as e:
-            logger.error(f"❌ Critical initialization error: {e}")
-            logger.error(traceback.format_exc())
+            logger.error("❌ Pipeline initialization failed: %s", e)
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(traceback.format_exc())
             
-            # Always return something
+            # Create minimal pipeline
             pipeline = MinimalPipeline()
-            logger.info("✅ Emergency minimal pipeline initialized")
+            logger.info("✅ Minimal pipeline initialized")
             return pipeline
 
+    except Exception as e:
+        logger.error("❌ Critical initialization error: %s", e)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(traceback.format_exc())
+        
+        # Always return something
+        pipeline = MinimalPipeline()
+        logger.info("✅ Emergency minimal pipeline initialized")
+        return pipeline
+
+
 class MinimalPipeline:
     """Minimal pipeline that always works"""
     
     def __init__(self):
         self.mode = "minimal"
         self.models = {}
+        self.loaded_models = ()
     
     def process_script(self, script: str, options: Dict) -> Dict:
         return {
@@ -230,60 +383,87 @@ class MinimalPipeline:
             "suggestion": "Check Docker dependencies and model downloads"
         }
 
+# "CHARACTER: line" dialogue in basic scripts
+_DIALOGUE_RE = re.compile(r"^([^:]+):\s*(.*)$")
+
+def _iter_script_blocks(script: str):
+    """Yield the blank-line separated blocks of a script as lists of lines"""
+    block = []
+    for line in script.splitlines():
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+@dataclass(slots=True)
+class BasicScriptScene:
+    """Scene produced by the basic script parser"""
+    id: str
+    description: str
+    duration: int = 10
+    resolution: str = "720p"
+    fps: int = 30
+    dialogue: List[Dict] = field(default_factory=list)
+    camera_movements: tuple = ("static shot",)
+    music_mood: str = "cinematic"
+    
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "description": self.description,
+            "duration": self.duration,
+            "resolution": self.resolution,
+            "fps": self.fps,
+            "dialogue": self.dialogue,
+            "camera_movements": list(self.camera_movements),
+            "music_mood": self.music_mood
+        }
+
+@lru_cache(maxsize=None)
+def _resolve_device() -> str:
+    """Resolve the torch device once per worker"""
+    return "cuda" if _HAS_TORCH and torch.cuda.is_available() else "cpu"
+
 class BasicPipeline:
     """Basic pipeline with core functionality"""
     
     def __init__(self, mode="basic"):
         self.mode = mode
         self.models = {}
-        
-        try:
-            import torch
-            self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            logger.info(f"Device: {self.device}")
-        except:
-            self.device = "cpu"
+        self.loaded_models = ()
+        self.device = _resolve_device()
+        logger.info("Device: %s", self.device)
     
     def process_script(self, script: str, options: Dict) -> Dict:
         # Basic script processing
         scenes = self._parse_script_basic(script)
         return {
             "status": "success",
-            "scenes": scenes,
+            "scenes": [scene.to_dict() for scene in scenes],
             "mode": self.mode,
             "note": "Using basic script parsing"
         }
     
-    def _parse_script_basic(self, script: str) -> List[Dict]:
+    def _parse_script_basic(self, script: str) -> List["BasicScriptScene"]:
         """Basic script parsing"""
         scenes = []
-        blocks = script.split("\n\n")
         
-        for i, block in enumerate(blocks):
-            if not block.strip():
-                continue
-                
-            lines = block.strip().split("\n")
-            description = lines[0] if lines else "Scene description"
-            
-            scene = {
-                "id": f"scene_{i+1:03d}",
-                "description": description,
-                "duration": 10,
-                "resolution": "720p",
-                "fps": 30,
-                "dialogue": [],
-                "camera_movements": ["static shot"],
-                "music_mood": "cinematic"
-            }
+        for i, lines in enumerate(_iter_script_blocks(script)):
+            scene = BasicScriptScene(
+                id=f"scene_{i+1:03d}",
+                description=lines[0].strip()
+            )
             
             # Extract dialogue
             for line in lines[1:]:
-                if ":" in line:
-                    character, text = line.split(":", 1)
-                    scene["dialogue"].append({
-                        "character": character.strip(),
-                        "text": text.strip()
+                match = _DIALOGUE_RE.match(line)
+                if match:
+                    scene.dialogue.append({
+                        "character": match.group(1).strip(),
+                        "text": match.group(2).strip()
                     })
             
             scenes.append(scene)
@@ -322,7 +502,7 @@ class BasicPipeline:
             
         except Exception as e:
             processing_time = time.time() - start_time
-            logger.error(f"Scene processing failed: {e}")
+            logger.error("Scene processing failed: %s", e)
             
             return {
                 "status": "error", 
@@ -342,53 +522,60 @@ class BasicPipeline:
             "note": "Basic concept processing"
         }
 
+@dataclass(slots=True)
+class SimpleScene:
+    """Scene built from a single_scene request"""
+    id: str = field(default_factory=lambda: f"scene_{int(time.time())}")
+    description: str = ""
+    duration: int = 5
+    resolution: str = "720p"
+    fps: int = 30
+
+_SIMPLE_SCENE_FIELDS = tuple(f.name for f in fields(SimpleScene))
+
 def process_job_sync(job_input: Dict) -> Dict:
     """Synchronous job processing function"""
     request_type = job_input.get("type", "script_to_video")
     
-    logger.info(f"📋 Processing job type: {request_type}")
+    logger.info("📋 Processing job type: %s", request_type)
     
     try:
         if request_type == "health_check":
             # Comprehensive health check
             try:
-                import torch
+                template = _HEALTH_TEMPLATE or _build_health_template(pipeline)
+                gpu_available = template["system"]["gpu_available"]
+                memory_allocated = torch.cuda.memory_allocated() if gpu_available else 0
                 
-                health_status = {
-                    "status": "healthy" if pipeline else "unhealthy",
-                    "timestamp": time.time(),
-                    "system": {
-                        "gpu_available": torch.cuda.is_available(),
-                        "device_count": torch.cuda.device_count() if torch.cuda.is_available() else 0,
-                        "memory_allocated": torch.cuda.memory_allocated() / 1024**3 if torch.cuda.is_available() else 0,
-                        "memory_cached": torch.cuda.memory_cached() / 1024**3 if torch.cuda.is_available() else 0
-                    },
-                    "pipeline": {
-                        "initialized": pipeline is not None,
-                        "mode": pipeline.mode if pipeline else "not_initialized",
-                        "models_loaded": list(pipeline.models.keys()) if pipeline and hasattr(pipeline, 'models') else []
-                    },
-                    "volume": {
-                        "id": VOLUME_ID,
-                        "endpoint": S3_ENDPOINT,
-                        "mounted": os.path.exists("/runpod-volume")
-                    }
+                health_status = template.copy()
+                health_status["timestamp"] = time.time()
+                health_status["system"] = {
+                    **template["system"],
+                    "memory_allocated": memory_allocated / 1024**3,
+                    "memory_reserved": torch.cuda.memory_reserved() / 1024**3 if gpu_available else 0
+                }
+                health_status["pipeline"] = {
+                    **template["pipeline"],
+                    "models_loaded": getattr(pipeline, 'loaded_models', ())
+                }
+                health_status["volume"] = {
+                    **template["volume"],
+                    **_volume_status()
                 }
                 
-                if torch.cuda.is_available():
+                if gpu_available:
                     health_status["gpu"] = {
-                        "name": torch.cuda.get_device_name(0),
-                        "vram_total_gb": torch.cuda.get_device_properties(0).total_memory / 1024**3,
-                        "vram_used_gb": torch.cuda.memory_allocated() / 1024**3,
-                        "vram_free_gb": (torch.cuda.get_device_properties(0).total_memory - torch.cuda.memory_allocated()) / 1024**3
+                        **template["gpu"],
+                        "vram_used_gb": memory_allocated / 1024**3,
+                        "vram_free_gb": template["gpu"]["vram_total_gb"] - memory_allocated / 1024**3
                     }
                 
                 # Check if video models are available
-                if pipeline and hasattr(pipeline, 'models'):
+                if pipeline:
                     video_models = []
-                    if 'ltx' in pipeline.models and pipeline.models['ltx']:
+                    if 'ltx' in pipeline.loaded_models:
                         video_models.append("LTX-Video")
-                    if 'hunyuan' in pipeline.models and pipeline.models['hunyuan']:
+                    if 'hunyuan' in pipeline.loaded_models:
                         video_models.append("HunyuanVideo")
                     
                     health_status["video_models_available"] = video_models
@@ -414,15 +601,9 @@ def process_job_sync(job_input: Dict) -> Dict:
             scene_data = job_input.get("scene", {})
             
             # Create simple scene object
-            class SimpleScene:
-                def __init__(self, data):
-                    self.id = data.get("id", f"scene_{int(time.time())}")
-                    self.description = data.get("description", "")
-                    self.duration = data.get("duration", 5)
-                    self.resolution = data.get("resolution", "720p")
-                    self.fps = data.get("fps", 30)
-            
-            scene = SimpleScene(scene_data)
+            scene = SimpleScene(**{
+                key: scene_data[key] for key in _SIMPLE_SCENE_FIELDS if key in scene_data
+            })
             return pipeline.process_complete_scene(scene)
 
         elif request_type == "script_to_video":
@@ -468,27 +649,32 @@ def process_job_sync(job_input: Dict) -> Dict:
                 loop.close()
 
         elif request_type == "list_models":
+            response = _LIST_MODELS_BASE.copy()
+            response["models"] = {
+                **_LIST_MODELS_BASE["models"],
+                "active": getattr(pipeline, 'loaded_models', ())
+            }
+            return response
+
+        elif request_type == "clear_models":
+            if pipeline and hasattr(pipeline, 'clear_models'):
+                pipeline.clear_models()
             return {
                 "status": "success",
-                "models": {
-                    "video": ["HunyuanVideo-13B", "LTX-Video-13B"],
-                    "audio": ["MusicGen-Large", "AudioGen-Medium"],
-                    "tts": ["XTTS-v2"],
-                    "active": list(pipeline.models.keys()) if pipeline and hasattr(pipeline, 'models') else []
-                },
-                "pipeline_mode": pipeline.mode if pipeline else "not_initialized"
+                "message": "Model cache cleared"
             }
 
         else:
             return {"error": f"Unknown request type: {request_type}"}
 
     except Exception as e:
-        logger.error(f"Job processing error: {e}")
-        logger.error(traceback.format_exc())
+        tb = traceback.format_exc()
+        logger.error("Job processing error: %s", e)
+        logger.error(tb)
         return {
             "status": "error",
             "error": str(e),
-            "traceback": traceback.format_exc()
+            "traceback": tb
         }
 
 def handler(event):
@@ -498,59 +684,59 @@ def handler(event):
         input_data = event["input"]
         job_id = event.get("id", "unknown")
 
-        logger.info(f"🎯 Job {job_id} started")
-        logger.info(f"Type: {input_data.get('type', 'unknown')}")
+        logger.info("🎯 Job %s started", job_id)
+        logger.info("Type: %s", input_data.get('type', 'unknown'))
 
-        # Initialize pipeline if not done
+        # Wait on the background initialization instead of queueing on its lock,
+        # then retry if it could not build a pipeline
+        if not pipeline_ready.is_set():
+            pipeline_ready.wait()
         if pipeline is None:
             initialize_pipeline()
 
         # Process job synchronously (no asyncio.run)
         result = process_job_sync(input_data)
 
-        logger.info(f"✅ Job {job_id} completed")
+        logger.info("✅ Job %s completed", job_id)
         return result
 
     except Exception as e:
-        logger.error(f"Handler error: {e}")
-        logger.error(traceback.format_exc())
+        tb = traceback.format_exc()
+        logger.error("Handler error: %s", e)
+        logger.error(tb)
         return {
             "status": "error",
             "error": str(e),
-            "traceback": traceback.format_exc()
+            "traceback": tb
         }
 
 # Initialize pipeline when module loads
 try:
-    # Set environment variables for optimal performance
-    os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "max_split_size_mb:512")
-    os.environ.setdefault("CUDA_LAUNCH_BLOCKING", "0")
-    os.environ.setdefault("HF_HOME", "/runpod-volume/cache")
-    os.environ.setdefault("DIFFUSERS_CACHE", "/runpod-volume/cache")
-    os.environ.setdefault("AUDIOCRAFT_CACHE_DIR", "/runpod-volume/cache")
-    
-    # Enable HF Transfer for faster downloads
-    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
-    
     # Initialize pipeline in background
     executor.submit(initialize_pipeline)
     
 except Exception as e:
-    logger.error(f"Module initialization failed: {e}")
+    logger.error("Module initialization failed: %s", e)
+    # Let handlers initialize on demand instead of waiting forever
+    pipeline_ready.set()
 
 if __name__ == "__main__":
+    # Only the worker entrypoint needs the runpod SDK - importing the module
+    # for handler() alone skips its import cost
+    import runpod
+    
     logger.info("🚀 Starting RunPod Cinema AI Worker - Production")
     logger.info("Version: 2.1 - August 2025 Edition")
     logger.info("Models: HunyuanVideo, LTX-Video, MusicGen, AudioGen, XTTS-v2")
-    logger.info(f"Volume: {VOLUME_ID}")
+    logger.info("Volume: %s", VOLUME_ID)
     
     # Initialize pipeline
     initialize_pipeline()
     
     # Log configuration
-    logger.info(f"Pipeline initialized: {pipeline is not None}")
+    logger.info("Pipeline initialized: %s", pipeline is not None)
     if pipeline:
-        logger.info(f"Pipeline mode: {pipeline.mode}")
+        logger.info("Pipeline mode: %s", pipeline.mode)
     
     # Start the serverless worker
     runpod.serverless.start({"handler": handler})
\ No newline at end of file
@@ -185,12 +185,12 @@ Script:
             return scenes
 
         except Exception as e:
-            logger.error(f"DeepSeek processing failed: {e}")
+            logger.error("DeepSeek processing failed: %s", e)
             return self._parse_script_fallback(script_text, max_duration)
 
     async def develop_concept(self, concept: str, options: Dict = None) -> Dict:
         """Develop a concept into a full script"""
-        logger.info(f"Developing concept: {concept[:100]}...")
+        logger.info("Developing concept: %s...", concept[:100])
 
         options = options or {}
         script_type = options.get("script_type", "short_film")
@@ -269,7 +269,7 @@ Also provide a JSON summary with:
             }
 
         except Exception as e:
-            logger.error(f"Concept development failed: {e}")
+            logger.error("Concept development failed: %s", e)
             return self._develop_concept_fallback(concept, options)
 
     def _parse_script_fallback(self, script_text: str, max_duration: int) -> List[ScriptScene]: